@@ -1,10 +1,13 @@
 #!/usr/bin/env python3
 import argparse
-import copy
+
+import pymongo
 
 from mailpy.db import DBManager
 from mailpy.db.connector import DBConnector
 
+BULK_WRITE_BATCH_SIZE = 1000
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser("Migration scripts for mongodb")
     parser.add_argument(
@@ -20,21 +23,40 @@ if __name__ == "__main__":
 
     db = connector.db
     entries_collection = db.get_collection(DBManager.ENTRIES_COLLECTION)
-    groups_collection = db.get_collection(DBManager.GROUPS_COLLECTION)
+
+    # Join each entry without 'group_id' to its group on the server side
+    pipeline = [
+        {"$match": {"group_id": {"$exists": False}}},
+        {
+            "$lookup": {
+                "from": DBManager.GROUPS_COLLECTION,
+                "localField": "group",
+                "foreignField": "name",
+                "as": "_groups",
+            }
+        },
+        {"$project": {"_id": 1, "group": 1, "_groups._id": 1}},
+    ]
 
     count = 0
-    for e in entries_collection.find():
-        new_e = copy.deepcopy(e)
-
-        if "group_id" not in e:
-            group = groups_collection.find_one({"name": e["group"]})
-            new_e["group_id"] = group["_id"]
-
-            entries_collection.update_one(
-                {"_id": new_e["_id"]}, {"$set": {"group_id": new_e["group_id"]}}
-            )
-            count = count + 1
-            print(
-                f'update entry {new_e["_id"]}, inset field \'group_id\' = {new_e["group_id"]}'
-            )
+    operations = []
+    for e in entries_collection.aggregate(pipeline):
+        if not e["_groups"]:
+            print(f'skip entry {e["_id"]}, group \'{e["group"]}\' not found')
+            continue
+
+        group_id = e["_groups"][0]["_id"]
+        operations.append(
+            pymongo.UpdateOne({"_id": e["_id"]}, {"$set": {"group_id": group_id}})
+        )
+        print(f"update entry {e['_id']}, inset field 'group_id' = {group_id}")
+
+        if len(operations) >= BULK_WRITE_BATCH_SIZE:
+            count += entries_collection.bulk_write(
+                operations, ordered=False
+            ).modified_count
+            operations = []
+
+    if operations:
+        count += entries_collection.bulk_write(operations, ordered=False).modified_count
     print(f"Update count {count}")
@@ -12,7 +12,7 @@ logger = logging.getLogger()
 
 class BaseEventConsumer:
     def __init__(self, name="EventConsumer") -> None:
-        self.queue: queue.Queue = queue.Queue()
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
         self._thread = threading.Thread(target=self._consume, daemon=True, name=name)
         self._running = False
 
@@ -37,12 +37,8 @@ class BaseEventConsumer:
                 logger.exception(f"Failed to consume event. Error '{e}'")
 
     def add(self, obj):
-        try:
-            self.queue.put(obj)
-        except queue.Full:
-            logger.exception(
-                f"Failed to add object '{obj}' to queue. Is the consumer still running?"
-            )
+        # SimpleQueue is unbounded, put never blocks nor raises queue.Full
+        self.queue.put(obj)
 
 
 class EmailConsumer(BaseEventConsumer):
@@ -54,7 +50,7 @@ class EmailConsumer(BaseEventConsumer):
         )
 
     def handle(self, obj):
-        if type(obj) == entities.AlarmEvent:
+        if isinstance(obj, entities.AlarmEvent):
             self.send_email(obj)
         else:
             logger.error(
@@ -1,4 +1,5 @@
 import queue
+import time
 import typing
 
 import epics
@@ -19,8 +20,6 @@ class EpicsConnector:
             connection_callback=self._dispatch_connection_changed_event,
             callback=self._dispatch_value_changed_event,
         )
-        if not self._pv.connected:
-            logger.warning(f"Epics PV {self._pv} is disconnected")
         self._entries: typing.Set[entities.Entry] = set()
 
     def _dispatch_value_changed_event(self, *_args, **kwargs):
@@ -51,19 +50,29 @@ class EpicsConnector:
         return entry in self._entries
 
     def add_entry(self, entry: entities.Entry):
-        if type(entry) != entities.Entry:
+        if not isinstance(entry, entities.Entry):
             raise ValueError(f"Invalid type for entry {type(entry)}")
         if self._has_entry(entry):
             return
 
         self._entries.add(entry)
 
+    def wait_for_connection(self, timeout: float) -> bool:
+        connected = self._pv.wait_for_connection(timeout=timeout)
+        if not connected:
+            logger.warning(f"Epics PV {self._pv} is disconnected")
+        return connected
+
     def tick(self):
         self._pv.run_callbacks()
 
 
 class DataConnector:
-    def __init__(self, db: db.DBManager, event_queue: queue.Queue):
+    def __init__(
+        self,
+        db: db.DBManager,
+        event_queue: typing.Union[queue.Queue, queue.SimpleQueue],
+    ):
         self._connectors: typing.Dict[str, EpicsConnector] = {}
         self._groups: typing.Dict[str, entities.Group] = {}
         self._db = db
@@ -78,6 +87,12 @@ class DataConnector:
         for _, c in self._connectors.items():
             c.tick()
 
+    def wait_for_connections(self, timeout: float = 5.0):
+        """Wait for all PV connections, channel searches are already in flight so they share a single deadline"""
+        deadline = time.monotonic() + timeout
+        for _, c in self._connectors.items():
+            c.wait_for_connection(timeout=max(deadline - time.monotonic(), 0.0))
+
     def create_entry(self, entry_data: entities.EntryData):
         # Create group if needed
         if not (entry_data.group in self._groups):
@@ -105,5 +120,5 @@ class DataConnector:
         self.add_group(entry.group)
 
     def add_group(self, group: entities.Group):
-        if type(group) == Group and not (group.name in self._groups):
+        if isinstance(group, Group) and not (group.name in self._groups):
             self._groups[group.name] = group
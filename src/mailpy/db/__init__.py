@@ -1,5 +1,6 @@
 import typing
 
+import bson
 import pymongo
 import pymongo.collection
 import pymongo.database
@@ -9,11 +10,25 @@ from mailpy.entities import ConditionEnums
 from mailpy.entities.entry import EntryData
 from mailpy.entities.event import Event
 from mailpy.entities.group import GroupData
+from mailpy.helpers import DBException
 
 from .connector import DBConnector
 
 logger = logging.getLogger()
 
+# Document fields required to build an EntryData, '_id' is always returned
+ENTRY_PROJECTION = {
+    "pvname": 1,
+    "emails": 1,
+    "condition": 1,
+    "alarm_values": 1,
+    "unit": 1,
+    "warning_message": 1,
+    "subject": 1,
+    "email_timeout": 1,
+    "group": 1,
+}
+
 
 class DBManager:
     CONDITIONS_COLLECTION = "conditions"
@@ -23,6 +38,9 @@ class DBManager:
 
     def __init__(self, connector: DBConnector):
         self._connector: DBConnector = connector
+        # Groups and conditions are effectively immutable while entries are loaded
+        self._group_cache: typing.Dict[str, GroupData] = {}
+        self._condition_cache: typing.Dict[str, typing.Any] = {}
 
     @property
     def db(self) -> pymongo.database.Database:
@@ -58,19 +76,93 @@ class DBManager:
             group=data["group"],
         )
 
-    def get_entries(self) -> typing.List[EntryData]:
+    def _create_entry_document(self, entry: EntryData) -> typing.Dict[str, typing.Any]:
+        group = self.get_group(entry.group)
+        return {
+            "pvname": entry.pvname,
+            "emails": ";".join(entry.emails),
+            "condition": entry.condition,
+            "alarm_values": entry.alarm_values,
+            "unit": entry.unit,
+            "warning_message": entry.warning_message,
+            "subject": entry.subject,
+            "email_timeout": entry.email_timeout,
+            "group": group.name,
+            "group_id": bson.ObjectId(group.id),
+        }
+
+    def create_entry_one(self, entry: EntryData) -> str:
+        entries: pymongo.collection.Collection = self.db[DBManager.ENTRIES_COLLECTION]
+        result = entries.insert_one(self._create_entry_document(entry))
+        return str(result.inserted_id)
+
+    def create_entries(
+        self, entries_data: typing.Iterable[EntryData]
+    ) -> typing.List[str]:
+        """Insert entries using a single round-trip, raises DBException if a group does not exist"""
+        documents = [self._create_entry_document(e) for e in entries_data]
+        if not documents:
+            return []
+
         entries: pymongo.collection.Collection = self.db[DBManager.ENTRIES_COLLECTION]
-        return [self._parse_entry(e) for e in entries.find()]
+        result = entries.insert_many(documents, ordered=False)
+        return [str(_id) for _id in result.inserted_ids]
+
+    def create_groups(
+        self, groups_data: typing.Iterable[GroupData]
+    ) -> typing.List[str]:
+        documents = [
+            {"name": g.name, "enabled": g.enabled, "description": g.description}
+            for g in groups_data
+        ]
+        if not documents:
+            return []
 
-    def get_group(self, group_name: str):
         groups: pymongo.collection.Collection = self.db[DBManager.GROUPS_COLLECTION]
-        return self._parse_group(groups.find_one({"name": group_name}))
+        result = groups.insert_many(documents, ordered=False)
+        self._group_cache.clear()
+        return [str(_id) for _id in result.inserted_ids]
+
+    def iter_entries(
+        self,
+        projection: typing.Optional[typing.Dict[str, int]] = ENTRY_PROJECTION,
+    ) -> typing.Iterator[EntryData]:
+        """Stream entries from the database cursor, a None projection returns the full documents"""
+        entries: pymongo.collection.Collection = self.db[DBManager.ENTRIES_COLLECTION]
+        for e in entries.find({}, projection=projection):
+            yield self._parse_entry(e)
+
+    def get_entries(self) -> typing.List[EntryData]:
+        return list(self.iter_entries())
+
+    def clear_cache(self):
+        self._group_cache.clear()
+        self._condition_cache.clear()
+
+    def get_group(self, group_name: str) -> GroupData:
+        if group_name in self._group_cache:
+            return self._group_cache[group_name]
+
+        groups: pymongo.collection.Collection = self.db[DBManager.GROUPS_COLLECTION]
+        data = groups.find_one({"name": group_name})
+        if data is None:
+            raise DBException(f"Group '{group_name}' does not exist")
+
+        group = self._parse_group(data)
+        self._group_cache[group_name] = group
+        return group
 
     def get_condition(self, name: str):
+        if name in self._condition_cache:
+            return self._condition_cache[name]
+
         conditions: pymongo.collection.Collection = self.db[
             DBManager.CONDITIONS_COLLECTION
         ]
-        return conditions.find_one({"name": name})
+        condition = conditions.find_one({"name": name})
+        if condition is not None:
+            self._condition_cache[name] = condition
+        return condition
 
     def persist_event(self, event: Event):
         events_collection: pymongo.collection.Collection = self.db[
@@ -88,6 +180,7 @@ class DBManager:
                 DBManager.CONDITIONS_COLLECTION
             ]
             result = conditions.insert_many(ConditionEnums.get_conditions())
+            self._condition_cache.clear()
 
             logger.info(f"Inserted {result.inserted_ids}")
         except Exception:
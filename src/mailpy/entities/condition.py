@@ -1,3 +1,5 @@
+import bisect
+import math
 import typing
 
 import mailpy.logging as logging
@@ -96,6 +98,7 @@ class ConditionInferiorThan(Condition):
             raise ConditionException(f"Cannot create condition with limits '{limits}'")
 
         self.alarm_limit = float(limits)
+        self._message = f"value required to be higher than {self.alarm_limit}"
 
     def check_alarm(self, value: typing.Any) -> typing.Optional[ConditionCheckResponse]:
         if type(value) != int and type(value) != float:
@@ -104,9 +107,7 @@ class ConditionInferiorThan(Condition):
             )
 
         if value < self.alarm_limit:
-            return ConditionCheckResponse(
-                message=f"value required to be higher than {self.alarm_limit}"
-            )
+            return ConditionCheckResponse(message=self._message)
         return None
 
 
@@ -125,6 +126,7 @@ class ConditionSuperiorThan(Condition):
             raise ConditionException(f"Cannot create condition with limits '{limits}'")
 
         self.alarm_limit = float(limits)
+        self._message = f"value required to be lower than {self.alarm_limit}"
 
     def check_alarm(self, value: typing.Any) -> typing.Optional[ConditionCheckResponse]:
         if type(value) != int and type(value) != float:
@@ -133,9 +135,7 @@ class ConditionSuperiorThan(Condition):
             )
 
         if value > self.alarm_limit:
-            return ConditionCheckResponse(
-                message=f"value required to be lower than {self.alarm_limit}"
-            )
+            return ConditionCheckResponse(message=self._message)
         return None
 
 
@@ -165,6 +165,7 @@ class ConditionOutOfRange(Condition):
 
         self.alarm_min = _min
         self.alarm_max = _max
+        self._message = f"from {self.alarm_min} to {self.alarm_max}"
 
     def check_alarm(self, value: float) -> typing.Optional[ConditionCheckResponse]:
         if type(value) != int and type(value) != float:
@@ -173,9 +174,7 @@ class ConditionOutOfRange(Condition):
             )
 
         if value < self.alarm_min or value > self.alarm_max:
-            return ConditionCheckResponse(
-                message=f"from {self.alarm_min} to {self.alarm_max}"
-            )
+            return ConditionCheckResponse(message=self._message)
 
         return None
 
@@ -223,6 +222,10 @@ class ConditionIncreasingStep(Condition):
         self.min_level = 0
         self.max_level = -1
 
+        # Value range of the current step level
+        self._lower_bound = -math.inf
+        self._upper_bound = math.inf
+
         self._parse_limits(limits=limits)
 
     @property
@@ -249,6 +252,16 @@ class ConditionIncreasingStep(Condition):
             s = v
         self.min_level = 0
         self.max_level = len(self.step_values)
+        self._set_level(0)
+
+    def _set_level(self, level: int):
+        self.step_level = level
+        self._lower_bound = (
+            self.step_values[level - 1] if level > self.min_level else -math.inf
+        )
+        self._upper_bound = (
+            self.step_values[level] if level < self.max_level else math.inf
+        )
 
     def get_level_str(self, level: int):
         if level == self.min_level:
@@ -267,13 +280,17 @@ class ConditionIncreasingStep(Condition):
                 f"Condition {self} requires a numeric input, received {type(value)}"
             )
 
+        if self._lower_bound <= value < self._upper_bound:
+            # Still within the current level
+            return None
+
         new_value_level = self.find_level_for_value(value)
         if new_value_level > self.step_level:
             # We are going up levels
             response = ConditionCheckResponse(
                 message=self.get_level_str(new_value_level)
             )
-            self.step_level = new_value_level
+            self._set_level(new_value_level)
             return response
 
         if new_value_level < self.step_level:
@@ -281,32 +298,27 @@ class ConditionIncreasingStep(Condition):
                 f"{self} going down from level {self.step_level} to {new_value_level}. {self.get_level_str(new_value_level)}"
             )
 
-        self.step_level = new_value_level
+        self._set_level(new_value_level)
         return None
 
     def find_level_for_value(self, value) -> int:
-        level = 0
-        for min_value in self.step_values:
-            # Locate the next level we belong
-            if min_value > value:
-                return level
-            level += 1
-        return level
-
+        # Number of step values lesser or equal than value
+        return bisect.bisect_right(self.step_values, value)
 
-def create_condition(condition: str, alarm_values: str) -> Condition:
-    if condition == ConditionEnums.OutOfRange:
-        return ConditionOutOfRange(limits=alarm_values)
 
-    elif condition == ConditionEnums.SuperiorThan:
-        return ConditionSuperiorThan(limits=alarm_values)
+_CONDITION_CLASSES: typing.Dict[str, typing.Type[Condition]] = {
+    ConditionEnums.OutOfRange: ConditionOutOfRange,
+    ConditionEnums.SuperiorThan: ConditionSuperiorThan,
+    ConditionEnums.InferiorThan: ConditionInferiorThan,
+    ConditionEnums.IncreasingStep: ConditionIncreasingStep,
+}
 
-    elif condition == ConditionEnums.InferiorThan:
-        return ConditionInferiorThan(limits=alarm_values)
 
-    elif condition == ConditionEnums.IncreasingStep:
-        return ConditionIncreasingStep(limits=alarm_values)
+def create_condition(condition: str, alarm_values: str) -> Condition:
+    condition_cls = _CONDITION_CLASSES.get(condition)
+    if condition_cls is None:
+        raise ConditionException(
+            f"Invalid condition '{condition}, factory does not support this."
+        )
 
-    raise ConditionException(
-        f"Invalid condition '{condition}, factory does not support this."
-    )
+    return condition_cls(limits=alarm_values)
@@ -1,5 +1,4 @@
 import queue
-import threading
 import time
 import typing
 
@@ -61,11 +60,29 @@ class EntryData(typing.NamedTuple):
 
 
 class Entry:
+    __slots__ = (
+        "_value_callback_id",
+        "_connection_callback_id",
+        "_id",
+        "_pvname",
+        "_condition",
+        "email_timeout",
+        "emails",
+        "group",
+        "event_queue",
+        "subject",
+        "unit",
+        "warning_message",
+        "_alarm_event_template",
+        "_next_allowed_ts",
+        "_str",
+    )
+
     def __init__(
         self,
         group: Group,
         entry_data: EntryData,
-        event_queue: queue.Queue,
+        event_queue: typing.Union[queue.Queue, queue.SimpleQueue],
     ):
         self._value_callback_id: typing.Optional[int] = None
         self._connection_callback_id: typing.Optional[int] = None
@@ -78,8 +95,6 @@ class Entry:
             alarm_values=entry_data.alarm_values,
         )
 
-        self._sms_queue_dispatch_lock = threading.RLock()
-
         self.email_timeout = entry_data.email_timeout
         self.emails = entry_data.emails
         self.group = group
@@ -88,8 +103,21 @@ class Entry:
         self.unit = entry_data.unit
         self.warning_message = entry_data.warning_message
 
-        # reset last_event_time for all PVs, so it start monitoring right away
-        self.last_event_time = time.time() - self.email_timeout
+        # Event fields that do not change between alarms
+        self._alarm_event_template = {
+            "pvname": self.pvname,
+            "unit": self.unit,
+            "warning": self.warning_message,
+            "subject": self.subject,
+            "emails": self.emails,
+            "condition": self.condition,
+        }
+
+        # Monotonic deadline for the next event, start monitoring right away
+        self._next_allowed_ts = time.monotonic()
+
+        # Entry fields do not change after creation, format it only once
+        self._str = f'Entry({self.id},"{self.pvname}","{self.condition}",{self.group.name},"{self.alarm_values}",{self.emails}>'
 
     @property
     def pvname(self):
@@ -116,20 +144,13 @@ class Entry:
             return None
 
         return create_alarm_event(
-            pvname=self.pvname,
+            **self._alarm_event_template,
             specified_value_message=cond_res.message,
-            unit=self.unit,
-            warning=self.warning_message,
-            subject=self.subject,
-            emails=self.emails,
-            condition=self.condition,
             value_measured=value,
         )
 
-    def is_timeout_active(self):
-        timestamp = time.time()
-        timedelta = timestamp - self.last_event_time
-        return timedelta < self.email_timeout
+    def is_timeout_active(self) -> bool:
+        return time.monotonic() < self._next_allowed_ts
 
     def handle_connection_change(self, data: ConnectionChangedInfo):
         if self.pvname != data.pvname:
@@ -153,11 +174,11 @@ class Entry:
         :return bool: Perform or not the alarm check.
         """
         if not self.group.enabled:
-            logger.debug(f"Ignoring {self} due to disabled group")
+            logger.debug("Ignoring %s due to disabled group", self)
             return
 
         if self.is_timeout_active():
-            logger.info(f"Ignoring event from {self}, timeout still active.")
+            logger.info("Ignoring event from %s, timeout still active.", self)
             return
 
         if data.value is None:
@@ -180,10 +201,11 @@ class Entry:
             return
 
         try:
-            with self._sms_queue_dispatch_lock:  # Lock used to maintain the last_event_time in sync with the queue
-                logger.info(f"New event '{event}' being dispatched from {self}")
-                self.event_queue.put(event, block=False, timeout=None)
-                self.last_event_time = time.time()
+            # No lock: put is already thread safe, and a lock here would not cover the
+            # timeout check, so concurrent callbacks could still dispatch twice
+            logger.info(f"New event '{event}' being dispatched from {self}")
+            self.event_queue.put(event, block=False, timeout=None)
+            self._next_allowed_ts = time.monotonic() + self.email_timeout
 
         except queue.Full:
             logger.exception(
@@ -191,4 +213,4 @@ class Entry:
             )
 
     def __str__(self):
-        return f'Entry({self.id},"{self.pvname}","{self.condition}",{self.group.name},"{self.alarm_values}",{self.emails}>'
+        return self._str
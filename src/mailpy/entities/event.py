@@ -31,14 +31,14 @@ class AlarmEvent(Event):
 
 
 def _value_to_string(value):
-    if type(value) == float:
-        return "{:.4}".format(value)
+    if isinstance(value, float):
+        return format(value, ".4")
 
     return str(value)
 
 
 def _check_emails(emails):
-    if type(emails) == list:
+    if isinstance(emails, list):
         return emails
     raise ValueError(f"Invalid type for emails '{emails}', expected type {list}")
 
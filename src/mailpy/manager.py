@@ -72,9 +72,9 @@ class Manager:
 
     def initialize_entries_from_database(self):
         """Load entries from database"""
-        entries_data = self.db.get_entries()
-        for entry_data in entries_data:
+        for entry_data in self.db.iter_entries():
             self.data_connector.create_entry(entry_data=entry_data)
+        self.data_connector.wait_for_connections()
 
     def start(self):
         self._start_consumers()
@@ -95,7 +95,7 @@ class Manager:
         while self._running:
             event = self.event_queue.get(block=True, timeout=None)
 
-            if type(event) != entities.AlarmEvent:
+            if not isinstance(event, entities.AlarmEvent):
                 logger.warning(f"Unknown event type {event} obtained from queue.")
                 continue
 
@@ -1,5 +1,4 @@
 import dataclasses
-import json
 import os
 import typing
 
@@ -8,6 +7,15 @@ import docker.models.containers
 
 from mailpy.db import EntryData, GroupData
 
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+
+    _json_loads = json.loads
+
 RESOURCES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "./resources")
 
 
@@ -80,7 +88,6 @@ class MongoContainerManager:
         if not self.check_image_exists(self.config.image):
             self.docker_client.images.pull(self.config.image)
 
-        self.docker_client.images.pull(self.config.image)
         return self.docker_client.containers.create(
             self.config.image,
             name=self.config.name,
@@ -96,18 +103,15 @@ class MongoContainerManager:
             detach=True,
         )
 
-    def check_image_exists(self, name):
-        tags = []
-        for str_l in [i.tags for i in self.docker_client.images.list()]:
-            for i in str_l:
-                tags.append(i)
-        return name in tags
+    def check_image_exists(self, name) -> bool:
+        # Filtered by the docker daemon using the image reference
+        return bool(self.docker_client.images.list(name=name))
 
     def remove_previous_mongodb_containers(self):
         container: docker.models.containers.Container
         for container in self.docker_client.containers.list(all=True):
             if (
-                type(container) == docker.models.containers.Container
+                isinstance(container, docker.models.containers.Container)
                 and container.name == self.config.name
             ):
                 container.stop()
@@ -120,24 +124,27 @@ class MongoJsonLoader:
         dirname: typing.Optional[str] = None,
         entries_filename: str = "entries.json",
         groups_filename: str = "groups.json",
+        sorted_on_disk: bool = False,
     ):
         if not dirname:
             dirname = dirname = os.path.join(RESOURCES_PATH, "mailpy-db-2021-11-29")
 
         self.entries_filename = _join_path(dirname, entries_filename)
         self.groups_filename = _join_path(dirname, groups_filename)
+        self.sorted_on_disk = sorted_on_disk
+
+    def _load_json(self, filename: str):
+        with open(filename, "rb") as file:
+            data = _json_loads(file.read())
+        if not isinstance(data, list):
+            raise RuntimeError(f"Expected {data} to be a list, received {type(data)}")
+        return data
 
     def load_groups(self):
-        with open(self.groups_filename, "r") as file:
-            data = json.load(file)
-            if type(data) != list:
-                raise RuntimeError(
-                    f"Expected {data} to be a list, received {type(data)}"
-                )
-
-            groups = [self._create_group(d) for d in data]
+        groups = [self._create_group(d) for d in self._load_json(self.groups_filename)]
+        if not self.sorted_on_disk:
             groups.sort(key=lambda x: x.id)
-            return groups
+        return groups
 
     def _create_group(self, d):
         return GroupData(
@@ -148,15 +155,12 @@ class MongoJsonLoader:
         )
 
     def load_entries(self):
-        with open(self.entries_filename, "r") as file:
-            data = json.load(file)
-            if type(data) != list:
-                raise RuntimeError(
-                    f"Expected {data} to be a list, received {type(data)}"
-                )
-            entries = [self._create_entry(d) for d in data]
+        entries = [
+            self._create_entry(d) for d in self._load_json(self.entries_filename)
+        ]
+        if not self.sorted_on_disk:
             entries.sort(key=lambda x: x.id)
-            return entries
+        return entries
 
     def _create_entry(self, d):
         return EntryData(
@@ -9,6 +9,7 @@ from mailpy.db import (
     make_db_manager,
 )
 from mailpy.entities.event import create_alarm_event
+from mailpy.helpers import DBException
 from mailpy.tools import MongoContainerManager, MongoJsonLoader
 
 
@@ -69,5 +70,36 @@ class TestDatabaseInteraction(unittest.TestCase):
             event = create_alarm_event(**e_data)
             db.persist_event(event)
 
+    def test_create_entries(self):
+        with make_db_manager(
+            url=create_mongodb_url(
+                db=self.container.config.database,
+                host=self.container.config.host,
+                password=self.container.config.password,
+                port=self.container.config.port,
+                user=self.container.config.username,
+            )
+        ) as db:
+            group = GroupData(
+                id="", name="CreateEntriesGroup", enabled=True, description=""
+            )
+            self.assertEqual(len(db.create_groups([group])), 1)
+
+            entries = [e._replace(group=group.name) for e in self.entries_fixture[:3]]
+            ids = db.create_entries(entries)
+            self.assertEqual(len(ids), len(entries))
+            self.assertEqual(db.create_entries([]), [])
+
+            entry_one = self.entries_fixture[3]._replace(group=group.name)
+            id_one = db.create_entry_one(entry_one)
+
+            inserted = {e.id: e for e in db.get_entries()}
+            for _id, entry in zip(ids, entries):
+                self.assertEqual(entry._replace(id=_id), inserted[_id])
+            self.assertEqual(entry_one._replace(id=id_one), inserted[id_one])
+
+            with self.assertRaises(DBException):
+                db.create_entries([entry_one._replace(group="MissingGroup")])
+
     def tearDown(self):
         self.container.stop()
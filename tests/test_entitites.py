@@ -124,3 +124,40 @@ class TestEntry(unittest.TestCase):
             )
         )
         self.assertEqual(q.qsize(), 0)
+
+    def test_entry_email_timeout(self):
+        q = queue.Queue()
+
+        g = Group("1", "gtest", True)
+        entry = Entry(
+            entry_data=EntryData(
+                alarm_values="1:2",
+                condition=ConditionEnums.OutOfRange,
+                email_timeout=3600,
+                emails=[""],
+                group=g,
+                id="e1",
+                pvname="TestPV",
+                subject="",
+                unit="",
+                warning_message="",
+            ),
+            group=g,
+            event_queue=q,
+        )
+        self.assertFalse(entry.is_timeout_active())
+
+        info = ValueChangedInfo(
+            pvname="TestPV",
+            value=0,
+            status=1,
+            host="host",
+            severity=0,
+        )
+        entry.handle_value_change(info)
+        self.assertEqual(q.qsize(), 1)
+        self.assertTrue(entry.is_timeout_active())
+
+        # Ignored while the timeout is active
+        entry.handle_value_change(info)
+        self.assertEqual(q.qsize(), 1)